@@ -1,25 +1,63 @@
 import subprocess
+import shlex
 import os
 import sys
-import tkinter
+import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from packaging.requirements import Requirement, InvalidRequirement
+
+# Ask the tkinter interpreter where its Tcl/Tk libraries live
+def query_tcl_tk_dirs():
+    try:
+        import tkinter
+    except ImportError:
+        return None
+
+    try:
+        tcl_dir = tkinter.Tcl().eval("info library")
+    except tkinter.TclError:
+        return None
+
+    # Tk is installed next to Tcl (e.g. tcl8.6 -> tk8.6)
+    tk_dir = os.environ.get("TK_LIBRARY") or os.path.join(
+        os.path.dirname(tcl_dir), os.path.basename(tcl_dir).replace("tcl", "tk")
+    )
+    if not (os.path.isdir(tcl_dir) and os.path.isdir(tk_dir)):
+        return None
+    return tcl_dir, tk_dir
 
 # Find tkinter files to bundle in binary
+@functools.lru_cache(maxsize=1)
 def get_tcl_tk_data():
+    dirs = query_tcl_tk_dirs()
+    if dirs:
+        return (f"{dirs[0]}{os.pathsep}tcl", f"{dirs[1]}{os.pathsep}tk")
+
+    # Fall back to probing the usual install locations
     paths = []
+    tcl_paths = []
+    tk_paths = []
+
+    # System locations only exist on Linux, don't stat them elsewhere
+    if sys.platform.startswith("linux"):
+        tcl_paths += [
+            "/usr/share/tcltk/tcl8.6",  # Ubuntu CI
+            "/usr/lib/tcl8.6",
+        ]
+        tk_paths += [
+            "/usr/share/tcltk/tk8.6",  # Ubuntu CI
+            "/usr/lib/tk8.6",
+        ]
 
     # Tcl library
-    tcl_paths = [
-        "/usr/share/tcltk/tcl8.6",  # Ubuntu CI
-        "/usr/lib/tcl8.6",
+    tcl_paths += [
         os.path.join(sys.prefix, "tcl"),
         os.path.join(sys.prefix, "lib", "tcl"),
     ]
 
     # Tk library
-    tk_paths = [
-        "/opt/hostedtoolcache/Python/3.11.13/x64/lib/python3.11/tkinter",  # Ubuntu CI
-        "/usr/share/tcltk/tk8.6",
-        "/usr/lib/tk8.6",
+    tk_paths += [
         os.path.join(sys.prefix, "tk"),
         os.path.join(sys.prefix, "lib", "tk"),
     ]
@@ -27,21 +65,20 @@ def get_tcl_tk_data():
     # Pick the first existing Tcl path
     for path in tcl_paths:
         if os.path.exists(path):
-            paths.append(f"{path}:tcl")
+            paths.append(f"{path}{os.pathsep}tcl")
             break
 
     # Pick the first existing Tk path
     for path in tk_paths:
         if os.path.exists(path):
-            paths.append(f"{path}:tk")
+            paths.append(f"{path}{os.pathsep}tk")
             break
 
-    return paths
-
+    return tuple(paths)
 
 
 # Imports that aren't explicitly listed in requirements.txt
-hidden_imports = [
+HIDDEN_IMPORTS = frozenset({
     "PIL._tkinter_finder",
     "tkinter",
     "tkinter.ttk",
@@ -51,43 +88,109 @@ hidden_imports = [
     "tkinter.filedialog",
     "tkinter.simpledialog",
     "tkinter.font",
+})
+
+# Packages whose submodules PyInstaller should collect itself instead of listing them by hand
+COLLECT_SUBMODULES = (
     "ttkbootstrap",
-    "ttkbootstrap.locales",
-    "ttkbootstrap.localization.msgs",
-    "ttkbootstrap.localization.msgcat",
-]
+)
 
 # Base PyInstaller command
-cmd = [
+# --noconfirm replaces an existing dist/Ocean without prompting (onedir builds would otherwise stop to ask)
+BASE_CMD = [
     "pyinstaller",
-    "--onefile",
+    "--noconfirm",
     "--name=Ocean",
     "--noconsole",
-    "--add-data=icon.png:.",
-    "--icon=icon.png",
-    "main.py"
+    # Absolute, since PyInstaller resolves relative data/icon paths against --specpath
+    f"--add-data={os.path.abspath('icon.png')}{os.pathsep}.",
+    f"--icon={os.path.abspath('icon.png')}",
 ]
 
-# Read requirements.txt if it exists
-if os.path.exists("requirements.txt"):
-    with open("requirements.txt") as f:
+SCRIPT = "main.py"
+
+# Package names from requirements.txt (if it exists), without versions/extras/markers
+def iter_requirements(path="requirements.txt"):
+    if not os.path.exists(path):
+        return
+    with open(path) as f:
         for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
+            line = line.partition(" #")[0].strip()  # drop inline comments
+            # Skip blanks, comments and pip options (-r, -e, --index-url, ...)
+            if not line or line.startswith(("#", "-")):
                 continue
-            pkg = line.split("==")[0]  # strip version if present
-            # Avoid duplicates
-            if f"--hidden-import={pkg}" not in cmd:
-                cmd.append(f"--hidden-import={pkg}")
-
-# Append hidden_imports to cmd
-for pkg in hidden_imports:
-    if f"--hidden-import={pkg}" not in cmd:
-                cmd.append(f"--hidden-import={pkg}")
-
-# append tkinter files
-for data in get_tcl_tk_data():
-    cmd.append(f"--add-data={data}")
-
-print("Running:", " ".join(cmd))
-subprocess.run(cmd)
+            try:
+                yield Requirement(line).name
+            except InvalidRequirement:
+                continue
+
+# Build variants and whether they use --onefile
+VARIANTS = {
+    "onedir": False,
+    "onefile": True,
+}
+
+# Assemble the full PyInstaller command once
+def build_cmd(onefile=False, variant=None):
+    # Onedir is the default: --onefile unpacks itself to a temp dir on every launch
+    mode_flags = ["--onefile"] if onefile else []
+
+    # Give each variant its own build/spec/dist paths so parallel builds don't collide
+    path_flags = [
+        f"--workpath={os.path.join('build', variant)}",
+        f"--specpath={os.path.join('build', variant)}",
+        f"--distpath={os.path.join('dist', variant)}",
+    ] if variant else []
+
+    # Requirements plus the extra hidden imports, sorted so the command is deterministic
+    hidden_flags = [f"--hidden-import={pkg}" for pkg in sorted(HIDDEN_IMPORTS.union(iter_requirements()))]
+    hidden_flags += [f"--collect-submodules={pkg}" for pkg in COLLECT_SUBMODULES]
+
+    # tkinter files
+    data_flags = [f"--add-data={data}" for data in get_tcl_tk_data()]
+
+    return BASE_CMD + mode_flags + path_flags + hidden_flags + data_flags + [SCRIPT]
+
+
+def run_cmd(cmd, verbose=False):
+    if verbose:
+        print("Running:", shlex.join(cmd))
+    # Keep this call plain (no preexec_fn, user/group or cwd changes) so CPython can
+    # start the child with vfork/posix_spawn instead of a full fork
+    return subprocess.run(cmd).returncode
+
+# Run PyInstaller inside this interpreter instead of spawning the pyinstaller CLI
+def run_in_process(cmd, verbose=False):
+    from PyInstaller.__main__ import run as pyi_run
+
+    if verbose:
+        print("Running:", shlex.join(cmd))
+    pyi_run(cmd[1:])
+    return 0
+
+# Build every variant at once, each PyInstaller run is an independent process
+def build_all_variants(verbose=False):
+    cmds = [build_cmd(onefile=onefile, variant=name) for name, onefile in VARIANTS.items()]
+    with ThreadPoolExecutor(max_workers=len(cmds)) as ex:
+        return_codes = list(ex.map(functools.partial(run_cmd, verbose=verbose), cmds))
+    return 1 if any(return_codes) else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Ocean binary with PyInstaller")
+    parser.add_argument("--pack-onefile", action="store_true",
+                        help="bundle into a single self-extracting executable (slower startup)")
+    parser.add_argument("--all-variants", action="store_true",
+                        help="build onedir and onefile in parallel into dist/<variant>/")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="print the PyInstaller command before running it")
+    args = parser.parse_args()
+
+    if args.all_variants:
+        return build_all_variants(verbose=args.verbose)
+
+    return run_in_process(build_cmd(onefile=args.pack_onefile), verbose=args.verbose)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,15 +8,25 @@ Minecraft plugin auto-builder GUI
 """
 
 import os
+import re
+import codecs
+import locale
 import sys
 import threading
 import tempfile
 import shutil
 import subprocess
 import stat
+import hashlib
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from urllib.parse import urlparse, urljoin
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, urljoin, quote
+from html import unescape
 from bs4 import BeautifulSoup
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
@@ -33,12 +43,33 @@ ttkbootstrap.localization.initialize_localities = bool
 # ---------- Configuration ----------
 TIMEOUT = 15
 USER_AGENT = "Mozilla/5.0 (compatible; PluginBuilder/1.0; OceanPluginBuilder/1.0)"
+PIPE_CHUNK_SIZE = 1 << 16  # bytes read from a build's output pipe at a time
+PAGE_CACHE_TTL = 300  # seconds a fetched plugin page is reused
+LOG_FLUSH_MS = 50  # how often buffered log lines are written to the GUI
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ocean")
+REPO_CACHE_DIR = os.path.join(CACHE_DIR, "repos")  # bare clones, one per repo URL
+CACHE_BRANCH = "ocean-build"  # local branch holding the fetched default branch
 # -----------------------------------
 
 session = requests.Session()
 session.headers.update({"User-Agent": USER_AGENT})
+# Pooled keep-alive connections per host, with retries for transient server errors
+adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+session.mount("https://", adapter)
+session.mount("http://", adapter)
 
 # ---------- Logging helpers (thread-safe) ----------
+gui_log_lock = threading.Lock()
+
 def log(msg, gui_log=None):
     ts = time.strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{ts}] {msg}"
@@ -49,28 +80,47 @@ def log(msg, gui_log=None):
 def gui_log_insert(gui_log, text):
     """
     Thread-safe insertion into scrolled text widget:
-    schedule the actual UI update on the main thread with .after(...)
+    lines are buffered and flushed on the main thread in batches with .after(...),
+    so a chatty build doesn't schedule one UI update per line
     """
-    def append():
-        try:
-            gui_log.configure(state="normal")
-            gui_log.insert(tk.END, text + "\n")
-            gui_log.yview(tk.END)
-            gui_log.configure(state="disabled")
-        except Exception:
-            # widget might be destroyed while worker thread still running
-            pass
+    if gui_log is None:
+        return
+    with gui_log_lock:
+        if not hasattr(gui_log, "_log_buffer"):
+            gui_log._log_buffer = []
+            gui_log._log_flush_pending = False
+        gui_log._log_buffer.append(text)
+        if gui_log._log_flush_pending:
+            return
+        gui_log._log_flush_pending = True
 
     try:
-        gui_log.after(0, append)
+        gui_log.after(LOG_FLUSH_MS, lambda: flush_gui_log(gui_log))
     except Exception:
         # if gui_log has no after (unlikely), fallback to immediate
-        append()
+        flush_gui_log(gui_log)
+
+def flush_gui_log(gui_log):
+    with gui_log_lock:
+        lines = gui_log._log_buffer
+        gui_log._log_buffer = []
+        gui_log._log_flush_pending = False
+    if not lines:
+        return
+    try:
+        gui_log.configure(state="normal")
+        gui_log.insert(tk.END, "\n".join(lines) + "\n")
+        gui_log.yview(tk.END)
+        gui_log.configure(state="disabled")
+    except Exception:
+        # widget might be destroyed while worker thread still running
+        pass
 
 # ---------- Command runner (streams output) ----------
-def run_command(cmd, cwd, gui_log=None):
+def run_command(cmd, cwd, gui_log=None, env=None):
     """
     Run external command streaming stdout/stderr to gui_log (thread-safe).
+    env: extra environment variables on top of the current environment.
     Returns True if exit code == 0.
     """
     # Accept cmd as list; if string, shlex split it for safety
@@ -85,10 +135,10 @@ def run_command(cmd, cwd, gui_log=None):
         process = subprocess.Popen(
             cmd_list,
             cwd=cwd,
+            env={**os.environ, **env} if env else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            bufsize=1,
-            universal_newlines=True
+            bufsize=PIPE_CHUNK_SIZE,
         )
     except FileNotFoundError as e:
         log(f"Command not found: {cmd_list[0]}", gui_log)
@@ -97,12 +147,26 @@ def run_command(cmd, cwd, gui_log=None):
         log(f"Failed to start process: {e}", gui_log)
         return False
 
-    # Stream output line-by-line to GUI
+    # Stream output to GUI: read raw chunks, decode incrementally, emit complete lines
+    decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+    pending = ""
     try:
-        for line in process.stdout:
-            gui_log_insert(gui_log, line.rstrip())
-    except Exception:
-        pass
+        for chunk in iter(lambda: process.stdout.read1(PIPE_CHUNK_SIZE), b""):
+            lines = (pending + decoder.decode(chunk)).split("\n")
+            pending = lines.pop()
+            for line in lines:
+                gui_log_insert(gui_log, line.rstrip())
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            gui_log_insert(gui_log, pending.rstrip())
+    except Exception as e:
+        # Keep draining so the process can't block on a full pipe before wait()
+        try:
+            while process.stdout.read1(PIPE_CHUNK_SIZE):
+                pass
+        except Exception:
+            pass
+        log(f"Stopped streaming output: {e}", gui_log)
 
     process.wait()
     rc = process.returncode
@@ -112,32 +176,67 @@ def run_command(cmd, cwd, gui_log=None):
 
 # ---------- Existing web / repo / build functions (kept mostly as-is) ----------
 def fetch_page(url):
+    # Pages fetched in the same PAGE_CACHE_TTL window are reused (e.g. when retrying a build)
+    return cached_fetch_page(url, int(time.time() // PAGE_CACHE_TTL))
+
+@functools.lru_cache(maxsize=64)
+def cached_fetch_page(url, ttl_bucket):
     resp = session.get(url, timeout=TIMEOUT)
     resp.raise_for_status()
     return resp.text
 
+# Code hosts we know how to clone/download from
+REPO_HOSTS = ("github.com", "gitlab.com", "bitbucket.org")
+REPO_HOST_SUFFIXES = tuple("." + h for h in REPO_HOSTS)
+
+def repo_host(netloc):
+    """
+    Return the supported code host a URL's netloc belongs to, or None.
+    """
+    host = netloc.rpartition("@")[2].partition(":")[0].lower()
+    if host in REPO_HOSTS:
+        return host
+    if host.endswith(REPO_HOST_SUFFIXES):
+        return next(h for h in REPO_HOSTS if host.endswith("." + h))
+    return None
+
+# Quoted <a href> pointing at a supported code host, matched on the raw HTML
+# (\s before href so attributes like data-href don't match)
+REPO_LINK_RE = re.compile(
+    r"""<a\s(?:[^>]*?\s)?href=["']([^"']*(?:%s)[^"']*)["']""" % "|".join(map(re.escape, REPO_HOSTS)),
+    re.IGNORECASE,
+)
+
+def in_html_comment(html, pos):
+    return html.rfind("<!--", 0, pos) > html.rfind("-->", 0, pos)
+
+def absolutize_href(href, base_url):
+    if href.startswith("/"):
+        parsed_base = urlparse(base_url)
+        href = parsed_base.scheme + "://" + parsed_base.netloc + href
+    return href
+
 def find_repo_link_from_html(html, base_url):
+    # Fast path: a direct repo link, no need to build a DOM
+    for m in REPO_LINK_RE.finditer(html):
+        if not in_html_comment(html, m.start()):
+            return absolutize_href(unescape(m.group(1)), base_url)
+    # Full parse for what the regex can't see (e.g. unquoted href values)
     soup = BeautifulSoup(html, "html.parser")
     for a in soup.find_all("a", href=True):
         href = a["href"]
-        if "github.com" in href or "gitlab.com" in href or "bitbucket.org" in href:
-            if href.startswith("/"):
-                parsed_base = urlparse(base_url)
-                href = parsed_base.scheme + "://" + parsed_base.netloc + href
-            return href
+        if any(host in href for host in REPO_HOSTS):
+            return absolutize_href(href, base_url)
     texts = soup.find_all(lambda tag: tag.name == "a" and tag.string and ("github" in tag.string.lower() or "source" in tag.string.lower()))
     for a in texts:
         href = a.get("href")
         if href:
-            if href.startswith("/"):
-                parsed_base = urlparse(base_url)
-                href = parsed_base.scheme + "://" + parsed_base.netloc + href
-            return href
+            return absolutize_href(href, base_url)
     return None
 
 def normalize_repo_url(repo_url):
     parsed = urlparse(repo_url)
-    if "github.com" in parsed.netloc or "gitlab.com" in parsed.netloc or "bitbucket.org" in parsed.netloc:
+    if repo_host(parsed.netloc):
         parts = parsed.path.rstrip("/").split("/")
         if len(parts) >= 3:
             new_path = "/".join(parts[:3])
@@ -146,8 +245,10 @@ def normalize_repo_url(repo_url):
 
 def try_git_clone(repo_url, dest, gui_log=None, use_latest_tag=False):
     """
-    Clone the repository. If use_latest_tag=True, checkout the latest tag
-    based on creation date (newest first).
+    Shallow-clone the repository through a persistent per-repo cache in
+    REPO_CACHE_DIR, so rebuilding the same plugin only fetches what changed.
+    If use_latest_tag=True, clone the latest tag (highest version name on the
+    remote) instead of the default branch.
     """
     try:
         log(f"Cloning {repo_url} into {dest}...", gui_log)
@@ -158,75 +259,184 @@ def try_git_clone(repo_url, dest, gui_log=None, use_latest_tag=False):
         log("Git not available on PATH.", gui_log)
         return False
 
+    cache = os.path.join(REPO_CACHE_DIR, hashlib.sha1(repo_url.encode()).hexdigest())
+    created_cache = False
     try:
-        subprocess.check_call(["git", "clone", repo_url, dest])
-        log("Cloned repository.", gui_log)
-
+        # Default branch is kept in the cache under a fixed local branch name
+        remote_ref, name, local_ref = "HEAD", CACHE_BRANCH, f"refs/heads/{CACHE_BRANCH}"
         if use_latest_tag:
-            # Get tags sorted by creation date (newest first)
-            tags = subprocess.check_output(
-                ["git", "tag", "--sort=-creatordate"], cwd=dest, text=True
+            # List tags on the remote (newest version first) instead of cloning history to find them
+            refs = subprocess.check_output(
+                ["git", "ls-remote", "--tags", "--refs", "--sort=-v:refname", repo_url], text=True
             ).splitlines()
+            tags = [ref.split("refs/tags/", 1)[1] for ref in refs if "refs/tags/" in ref]
 
             if not tags:
                 log("No tags found; using default branch.", gui_log)
             else:
                 latest_tag = tags[0]
-                log(f"Checking out latest tag: {latest_tag}", gui_log)
-                subprocess.check_call(["git", "checkout", latest_tag], cwd=dest)
+                log(f"Using latest tag: {latest_tag}", gui_log)
+                remote_ref = local_ref = f"refs/tags/{latest_tag}"
+                name = latest_tag
 
+        if not os.path.isdir(cache):
+            subprocess.check_call(["git", "init", "--quiet", "--bare", cache])
+            created_cache = True
+        else:
+            log(f"Using cached repository: {cache}", gui_log)
+
+        # Only the tip is built, so skip the history; objects already cached aren't re-downloaded
+        subprocess.check_call(
+            ["git", "-C", cache, "fetch", "--depth", "1", repo_url, f"+{remote_ref}:{local_ref}"]
+        )
+        subprocess.check_call(
+            ["git", "clone", "--single-branch", "--branch", name, cache, dest]
+        )
+        subprocess.check_call(["git", "-C", dest, "remote", "set-url", "origin", repo_url])
+        log("Cloned repository.", gui_log)
         return True
 
     except subprocess.CalledProcessError as e:
         log(f"git clone failed: {e}", gui_log)
+        # don't leave a half-initialised cache behind; an existing one is kept,
+        # a transient network error shouldn't throw away everything cached so far
+        if created_cache:
+            shutil.rmtree(cache, ignore_errors=True)
         return False
 
 
+def probe_url(url):
+    """
+    HEAD a URL and return its status code, or None if the request failed.
+    """
+    try:
+        return session.head(url, allow_redirects=True, timeout=TIMEOUT).status_code
+    except requests.RequestException:
+        return None
+
+# Top-level repo directories that don't take part in a build; one that holds
+# a build script is a subproject and is extracted anyway
+ZIP_SKIP_DIRS = {".github", ".idea", ".vscode", "docs", "images", "screenshots"}
+
+def zip_build_members(names):
+    """
+    Return the archive member names worth extracting for a build.
+    """
+    # Host archives wrap everything in a single "<repo>-<branch>/" folder
+    wrapped = len({n.split("/", 1)[0] for n in names}) == 1
+    depth = 1 if wrapped else 0
+
+    split = [n.split("/") for n in names]
+    subprojects = {
+        parts[depth] for parts in split
+        if len(parts) == depth + 2 and parts[-1] in BUILD_FILES
+    }
+    skip = ZIP_SKIP_DIRS - subprojects
+    return [
+        name for name, parts in zip(names, split)
+        if not (len(parts) > depth + 1 and parts[depth] in skip)
+    ]
+
+def default_branch(host, path):
+    """
+    Look up a repository's default branch through the host's API.
+    Returns None if the lookup fails (unknown repo, rate limited, ...).
+    """
+    parts = path.strip("/").split("/")
+    if len(parts) < 2:
+        return None
+    owner, name = parts[0], parts[1].removesuffix(".git")
+
+    if host == "github.com":
+        api_url, keys = f"https://api.github.com/repos/{owner}/{name}", ("default_branch",)
+    elif host == "gitlab.com":
+        project = quote(f"{owner}/{name}", safe="")
+        api_url, keys = f"https://gitlab.com/api/v4/projects/{project}", ("default_branch",)
+    elif host == "bitbucket.org":
+        api_url, keys = f"https://api.bitbucket.org/2.0/repositories/{owner}/{name}", ("mainbranch", "name")
+    else:
+        return None
+
+    try:
+        resp = session.get(api_url, timeout=TIMEOUT)
+        if resp.status_code != 200:
+            return None
+        value = resp.json()
+        for key in keys:
+            value = value[key]
+        return value if isinstance(value, str) and value else None
+    except (requests.RequestException, ValueError, KeyError, TypeError):
+        return None
+
 def try_zip_download(repo_url, dest, gui_log=None):
     parsed = urlparse(repo_url)
-    net = parsed.netloc.lower()
+    host = repo_host(parsed.netloc)
     path = parsed.path.rstrip("/")
 
-    candidates = []
-    if "github.com" in net:
-        candidates = [
-            f"{repo_url}/archive/refs/heads/main.zip",
-            f"{repo_url}/archive/refs/heads/master.zip",
-            f"{repo_url}/archive/refs/heads/develop.zip",
-        ]
-    elif "gitlab.com" in net:
-        candidates = [
-            f"{repo_url}/-/archive/main/{os.path.basename(path)}-main.zip",
-            f"{repo_url}/-/archive/master/{os.path.basename(path)}-master.zip",
-        ]
-    elif "bitbucket.org" in net:
-        candidates = [
-            f"{repo_url}/get/main.zip",
-            f"{repo_url}/get/master.zip",
-        ]
-    else:
+    if not host:
         log("Zip download not supported for this host automatically.", gui_log)
         return False
 
+    # Ask the host for the default branch so exactly one archive is fetched;
+    # fall back to guessing common branch names if the API lookup fails
+    branch = default_branch(host, path)
+    if branch:
+        log(f"Default branch: {branch}", gui_log)
+        branches = [branch]
+    elif host == "github.com":
+        branches = ["main", "master", "develop"]
+    else:
+        branches = ["main", "master"]
+
+    name = os.path.basename(path)
+    if host == "github.com":
+        candidates = [f"{repo_url}/archive/refs/heads/{b}.zip" for b in branches]
+    elif host == "gitlab.com":
+        candidates = [f"{repo_url}/-/archive/{b}/{name}-{b}.zip" for b in branches]
+    else:
+        candidates = [f"{repo_url}/get/{b}.zip" for b in branches]
+
     import zipfile
-    from io import BytesIO
 
-    for c in candidates:
+    if branch:
+        # The branch is known to exist, nothing to probe
+        statuses = [200]
+    else:
+        # Cheap HEAD probes first so wrong branches don't cost a full GET;
+        # they run concurrently so each miss doesn't add a round trip
+        with ThreadPoolExecutor(max_workers=len(candidates)) as ex:
+            statuses = list(ex.map(probe_url, candidates))
+
+    for c, status in zip(candidates, statuses):
         try:
-            log(f"Attempting zip download: {c}", gui_log)
-            r = session.get(c, timeout=TIMEOUT, stream=True)
-            if r.status_code != 200:
-                log(f"Not found: {c} (status {r.status_code})", gui_log)
+            # 405: host doesn't support HEAD, fall through to the GET
+            if status not in (200, 405):
+                log(f"Not found: {c} (status {status})", gui_log)
                 continue
-            z = zipfile.ZipFile(BytesIO(r.content))
-            z.extractall(dest)
+            log(f"Attempting zip download: {c}", gui_log)
+            with session.get(c, timeout=TIMEOUT, stream=True) as r:
+                if r.status_code != 200:
+                    log(f"Not found: {c} (status {r.status_code})", gui_log)
+                    continue
+                # Stream the archive to disk instead of holding it all in memory
+                r.raw.decode_content = True
+                tf = tempfile.NamedTemporaryFile(delete=False, suffix=".zip")
+                try:
+                    with tf:
+                        shutil.copyfileobj(r.raw, tf, length=1 << 16)
+                    with zipfile.ZipFile(tf.name) as z:
+                        z.extractall(dest, members=zip_build_members(z.namelist()))
+                finally:
+                    # also removes a partial download if the transfer failed
+                    os.unlink(tf.name)
             entries = os.listdir(dest)
             if len(entries) == 1:
                 top = os.path.join(dest, entries[0])
                 if os.path.isdir(top):
+                    # Same filesystem, so a plain rename is enough
                     for name in os.listdir(top):
-                        shutil.move(os.path.join(top, name), os.path.join(dest, name))
-                    shutil.rmtree(top)
+                        os.replace(os.path.join(top, name), os.path.join(dest, name))
+                    os.rmdir(top)
             log("Zip downloaded and extracted.", gui_log)
             return True
         except Exception as e:
@@ -234,6 +444,10 @@ def try_zip_download(repo_url, dest, gui_log=None):
             continue
     return False
 
+# Jars that are never the plugin itself, and names used by shadow/fat jars
+BAD_JAR_RE = re.compile(r"sources|javadoc|tests|original-|gradle|build-logic\.jar")
+SHADOW_JAR_RE = re.compile(r"shadow|all")
+
 def filter_plugin_jars(jar_list, prefer_shadow=True):
     """
     Return all usable plugin jars from a list of produced jars.
@@ -243,21 +457,17 @@ def filter_plugin_jars(jar_list, prefer_shadow=True):
     if not jar_list:
         return []
 
-    filtered = [
-        j for j in jar_list
-        if not any(bad in os.path.basename(j).lower()
-                   for bad in ("sources", "javadoc", "tests", "original-", "gradle", "build-logic.jar"))
-    ]
+    filtered = [j for j in jar_list if not BAD_JAR_RE.search(os.path.basename(j).lower())]
     if not filtered:
         return []
 
     if prefer_shadow:
-        shadowed = [j for j in filtered if any(kw in os.path.basename(j).lower() for kw in ("shadow", "all"))]
+        shadowed = [j for j in filtered if SHADOW_JAR_RE.search(os.path.basename(j).lower())]
         if shadowed:
             return shadowed
 
     # return all remaining filtered jars, sorted by modification time descending
-    filtered.sort(key=lambda p: os.path.getmtime(p), reverse=True)
+    filtered.sort(key=os.path.getmtime, reverse=True)
     return filtered
 
 
@@ -271,28 +481,61 @@ def ensure_executable(path, gui_log=None):
     except Exception as e:
         log(f"Failed to chmod +x {path}: {e}", gui_log)
 
-def find_build_files(root):
-    res = {
-        "gradlew": None,
-        "build_gradle": None,
-        "build_gradle_kts": None,
-        "pom_xml": None,
-    }
-    for dirpath, dirnames, filenames in os.walk(root):
-        for f in filenames:
-            if f == "gradlew":
-                res["gradlew"] = os.path.join(dirpath, f)
-            if f == "build.gradle":
-                res["build_gradle"] = os.path.join(dirpath, f)
-            if f == "build.gradle.kts":
-                res["build_gradle_kts"] = os.path.join(dirpath, f)
-            if f == "pom.xml":
-                res["pom_xml"] = os.path.join(dirpath, f)
-        if any(res.values()):
-            if res["gradlew"]:
-                return res
+# Build file name -> key in find_build_files() result
+BUILD_FILES = {
+    "gradlew": "gradlew",
+    "build.gradle": "build_gradle",
+    "build.gradle.kts": "build_gradle_kts",
+    "pom.xml": "pom_xml",
+}
+# Directories that never hold the project's own build files
+SKIP_DIRS = {".git", ".gradle", "node_modules", "build", "target"}
+# Directories skipped when collecting built jars (build/ and target/ are where jars end up)
+JAR_SKIP_DIRS = {".git", ".gradle", "node_modules", ".idea", ".mvn"}
+
+def find_build_files(root, max_depth=3):
+    res = {key: None for key in BUILD_FILES.values()}
+    # Breadth-first so the root (where nearly every project keeps these) is checked first
+    queue = deque([(root, 0)])
+    while queue:
+        path, depth = queue.popleft()
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if depth < max_depth and entry.name not in SKIP_DIRS:
+                    queue.append((entry.path, depth + 1))
+            elif entry.name in BUILD_FILES and not res[BUILD_FILES[entry.name]]:
+                res[BUILD_FILES[entry.name]] = entry.path
+        if res["gradlew"]:
+            return res
+        if depth == 0 and any(res.values()):
+            return res
     return res
 
+# Build cache (kept in the Gradle user home, so it survives between runs) and
+# parallel tasks, passed as Gradle properties: wrappers too old to know a
+# property ignore it, unlike an unknown CLI flag.
+GRADLE_PERF_ARGS = [
+    "-Dorg.gradle.caching=true",
+    "-Dorg.gradle.parallel=true",
+]
+# Build modules in parallel (one thread per core), no per-artifact download logging
+MAVEN_PERF_ARGS = ["-T", "1C", "--no-transfer-progress"]
+
+def build_env():
+    """
+    Extra environment for build tools; settings the user already has win.
+    Gradle keeps its default user home (~/.gradle), which already persists
+    across builds and holds the user's JDK/proxy/credential settings.
+    """
+    env = {}
+    if "MAVEN_OPTS" not in os.environ:
+        env["MAVEN_OPTS"] = "-Xmx2g"
+    return env
+
 def run_build(project_root, gui_log=None, prefer_shadow=False):
     """
     Try to build the project. Returns (success:boolean, path_to_jar_list:list)
@@ -304,37 +547,38 @@ def run_build(project_root, gui_log=None, prefer_shadow=False):
     ensure_executable(bf.get("gradlew"), gui_log)
     ensure_executable(os.path.join(project_root, "gradlew"), gui_log)
     ensure_executable(os.path.join(project_root, "mvnw"), gui_log)
+    env = build_env()
 
     if bf["gradlew"]:
         work_dir = os.path.dirname(bf["gradlew"])
         # Try shadowJar first if requested
         if prefer_shadow:
-            cmd_shadow = ["./gradlew", "shadowJar", "-x", "test"]
+            cmd_shadow = ["./gradlew", "shadowJar", "-x", "test", *GRADLE_PERF_ARGS]
             if sys.platform == "win32":
                 cmd_shadow[0] = "gradlew.bat"
-            ok_shadow = run_command(cmd_shadow, cwd=work_dir, gui_log=gui_log)
+            ok_shadow = run_command(cmd_shadow, cwd=work_dir, gui_log=gui_log, env=env)
             if not ok_shadow:
                 log("shadowJar failed or not present; falling back to build.", gui_log)
             else:
                 # continue to collect jars below
                 pass
 
-        cmd = ["./gradlew", "build", "-x", "test"]
+        cmd = ["./gradlew", "build", "-x", "test", *GRADLE_PERF_ARGS]
         if sys.platform == "win32":
             cmd[0] = "gradlew.bat"
-        ok = run_command(cmd, cwd=work_dir, gui_log=gui_log)
+        ok = run_command(cmd, cwd=work_dir, gui_log=gui_log, env=env)
         if not ok:
             log("Gradle wrapper build failed.", gui_log)
             return False, []
     elif bf["build_gradle"] or bf["build_gradle_kts"]:
         work_dir = os.path.dirname(bf["build_gradle"] or bf["build_gradle_kts"])
-        ok = run_command(["gradle", "build", "-x", "test"], cwd=work_dir, gui_log=gui_log)
+        ok = run_command(["gradle", "build", "-x", "test", *GRADLE_PERF_ARGS], cwd=work_dir, gui_log=gui_log, env=env)
         if not ok:
             log("System Gradle build failed.", gui_log)
             return False, []
     elif bf["pom_xml"]:
         work_dir = os.path.dirname(bf["pom_xml"])
-        ok = run_command(["mvn", "-DskipTests", "package"], cwd=work_dir, gui_log=gui_log)
+        ok = run_command(["mvn", "-DskipTests", *MAVEN_PERF_ARGS, "package"], cwd=work_dir, gui_log=gui_log, env=env)
         if not ok:
             log("Maven build failed.", gui_log)
             return False, []
@@ -344,15 +588,24 @@ def run_build(project_root, gui_log=None, prefer_shadow=False):
 
     jars = []
     for dirpath, dirnames, filenames in os.walk(project_root):
+        # prune directories that never contain the project's own jars
+        dirnames[:] = [d for d in dirnames if d not in JAR_SKIP_DIRS]
         for f in filenames:
-            if f.endswith(".jar"):
-                full = os.path.join(dirpath, f)
-                if "/.gradle/" in full.replace("\\", "/"):
-                    continue
-                jars.append(full)
-    jars.sort(key=lambda p: os.path.getmtime(p), reverse=True)
+            if f.lower().endswith(".jar"):
+                jars.append(os.path.join(dirpath, f))
+    jars.sort(key=os.path.getmtime, reverse=True)
     return (len(jars) > 0), jars
 
+def fast_copy(src, dst):
+    """
+    Hardlink src to dst when both are on the same filesystem (no data copied),
+    otherwise (or if dst already exists) fall back to a regular copy.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 # ---------- GUI Worker ----------
 def worker_process(url, out_dir, gui_log, progress_var, btn_start, status_var, recent_listbox, prefer_shadow, keep_temp_var, use_latest_tag_var):
     tmpdir = None
@@ -381,7 +634,7 @@ def worker_process(url, out_dir, gui_log, progress_var, btn_start, status_var, r
             except Exception as e:
                 log(f"Failed to fetch or parse page: {e}", gui_log)
         else:
-            if any(host in parsed.netloc for host in ("github.com", "gitlab.com", "bitbucket.org")):
+            if repo_host(parsed.netloc):
                 repo_url = normalize_repo_url(url)
                 log(f"Assuming provided URL is repo: {repo_url}", gui_log)
             else:
@@ -435,7 +688,7 @@ def worker_process(url, out_dir, gui_log, progress_var, btn_start, status_var, r
         copied = []
         for jar in usable_jars:
             dest = os.path.join(out_dir, os.path.basename(jar))
-            shutil.copy2(jar, dest)
+            fast_copy(jar, dest)
             copied.append(dest)
             log(f"Copied {jar} -> {dest}", gui_log)
 